@@ -2,10 +2,22 @@
 Category management for different types of domain blocklists.
 """
 
-from .base import BaseCategory
-from .gambling import GamblingCategory
-from .suspicious import SuspiciousCategory
-from .malicious import MaliciousCategory
-from .adult import AdultCategory
+import importlib
+
+# Category classes are imported on first access so loading one category
+# does not import every other category module
+_LAZY_IMPORTS = {
+    'BaseCategory': '.base',
+    'GamblingCategory': '.gambling',
+    'SuspiciousCategory': '.suspicious',
+    'MaliciousCategory': '.malicious',
+    'AdultCategory': '.adult'
+}
 
 __all__ = ['BaseCategory', 'GamblingCategory', 'SuspiciousCategory', 'MaliciousCategory', 'AdultCategory']
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -3,15 +3,37 @@
 Base category class for domain blocklist categories.
 """
 
+import copy
+import functools
+import gzip
 import json
 import os
-import sys
 from abc import ABC, abstractmethod
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from core import DomainFetcher, DomainProcessor, get_jakarta_time
+from core.utils import dump_json, write_atomic
+
+# Header written at the top of every blocklist file
+_HEADER_TEMPLATE = (
+    "/**\n"
+    "Lyra - Mapping the universe of threats\n"
+    "Category: {name}\n"
+    "Website: https://blog.intellibron.io/\n"
+    "Copyright 2025 ITSEC R&D\n"
+    "**/\n"
+    "\n"
+)
+
+@functools.lru_cache(maxsize=None)
+def _load_config_cached(config_path):
+    """Read and parse a config file once per process"""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+@functools.lru_cache(maxsize=None)
+def _get_fetcher(timeout):
+    """Return a fetcher shared by all categories so HTTP connections are reused"""
+    return DomainFetcher(timeout=timeout)
 
 class BaseCategory(ABC):
     """Base class for all domain blocklist categories"""
@@ -28,14 +50,15 @@ class BaseCategory(ABC):
         self.global_config = self.config.get("global_settings", {})
         
         # Initialize core components
-        self.fetcher = DomainFetcher(timeout=self.global_config.get("timeout", 15))
+        self.fetcher = _get_fetcher(self.global_config.get("timeout", 15))
         self.processor = DomainProcessor()
+        self._dirs_ready = False
     
     def _load_config(self):
         """Load configuration from JSON file"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # Deep copy so one category cannot mutate the shared cached config
+            return copy.deepcopy(_load_config_cached(self.config_path))
         except Exception as e:
             print(f"[ERROR] Failed to load config from {self.config_path}: {e}")
             return {"categories": {}, "global_settings": {}}
@@ -66,6 +89,11 @@ class BaseCategory(ABC):
             output_dir = os.path.join(parent_dir, output_dir)
         return os.path.join(output_dir, self.output_file)
     
+    @property
+    def gzip_output_path(self):
+        """Get gzip-compressed output file path"""
+        return f"{self.output_path}.gz"
+    
     @property
     def stats_path(self):
         """Get stats file path"""
@@ -92,31 +120,35 @@ class BaseCategory(ABC):
         Fetch domains from all configured sources
         
         Returns:
-            tuple: (raw_domains, source_stats)
+            tuple: (raw_domains, source_stats, per_source_lines)
         """
         print(f"[INFO] Fetching domains for category: {self.name}")
         return self.fetcher.fetch_multiple_sources(self.sources)
     
-    def process_domains(self, raw_domains, source_name=None):
+    def process_domains(self, raw_domains, source_name=None, into=None):
         """
         Process raw domains into normalized and priority sets
 
         Args:
             raw_domains (list): List of raw domain strings
             source_name (str, optional): Name of the source for specific handling
+            into (set, optional): Existing set to add normalized domains to in place
 
         Returns:
             tuple: (normalized_domains, priority_domains)
         """
-        return self.processor.process_domains(raw_domains, self.priority_keywords, source_name)
+        return self.processor.process_domains(raw_domains, self.priority_keywords, source_name, into)
     
     def load_existing_domains(self):
         """Load existing domains from output file"""
         return self.processor.load_existing_domains(self.output_path)
     
     def merge_domains(self, existing_domains, new_domains, priority_domains):
-        """Merge existing and new domains"""
-        return self.processor.merge_domains(existing_domains, new_domains, priority_domains)
+        """Merge new domains into the existing set"""
+        return self.processor.merge_domains(
+            existing_domains, new_domains, priority_domains,
+            collapse_subdomains=self.global_config.get("collapse_subdomains", False)
+        )
     
     def build_blocklist(self):
         """
@@ -127,15 +159,17 @@ class BaseCategory(ABC):
         """
         print(f"[INFO] Building blocklist for category: {self.name}")
         
-        # Ensure output directories exist
-        os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
-        os.makedirs(os.path.dirname(self.stats_path), exist_ok=True)
+        # Ensure output directories exist (once per instance)
+        if not self._dirs_ready:
+            os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
+            os.makedirs(os.path.dirname(self.stats_path), exist_ok=True)
+            self._dirs_ready = True
         
         # Load existing domains
         existing_domains = self.load_existing_domains()
         
         # Fetch new domains
-        raw_domains, source_stats = self.fetch_domains()
+        raw_domains, source_stats, per_source_lines = self.fetch_domains()
 
         # Process domains
         normalized_domains, priority_domains = self.process_domains(raw_domains)
@@ -145,7 +179,7 @@ class BaseCategory(ABC):
             if stats['status'] == 'success':
                 # Calculate domains from this specific source
                 source_domains, source_priority = self.process_domains(
-                    self.fetcher.fetch_source(source_name, stats['url'])[1],
+                    per_source_lines[source_name],
                     source_name
                 )
                 stats.update({
@@ -158,8 +192,14 @@ class BaseCategory(ABC):
             existing_domains, normalized_domains, priority_domains
         )
         
-        # Save domains to file
-        self._save_domains(final_domains_list)
+        # Save domains to file, skipping the rewrite when nothing changed
+        if (merge_stats['newly_added_count'] == 0
+                and merge_stats['total_count'] == merge_stats['existing_count']
+                and os.path.exists(self.output_path)
+                and os.path.exists(self.gzip_output_path)):
+            print(f"[INFO] No new domains for {self.name}, keeping {self.output_path}")
+        else:
+            self._save_domains(final_domains_list)
         
         # Prepare overall stats
         overall_stats = {
@@ -183,26 +223,20 @@ class BaseCategory(ABC):
     def _save_domains(self, domains_list):
         """Save domains list to output file with header"""
         encoding = self.global_config.get("encoding", "utf-8")
-        with open(self.output_path, "w", encoding=encoding) as f:
-            # Write header
-            f.write("/**\n")
-            f.write("Lyra - Mapping the universe of threats\n")
-            f.write(f"Category: {self.name}\n")
-            f.write("Website: https://blog.intellibron.io/\n")
-            f.write("Copyright 2025 ITSEC R&D\n")
-            f.write("**/\n")
-            f.write("\n")
+        header = _HEADER_TEMPLATE.format(name=self.name)
+        # Encode the whole file once; it is written both plain and gzipped
+        body = "\n".join(domains_list) + "\n" if domains_list else ""
+        payload = (header + body).encode(encoding)
 
-            # Write domains
-            for domain in domains_list:
-                f.write(domain + "\n")
-        print(f"[INFO] Saved {len(domains_list):,} domains to {self.output_path}")
+        write_atomic(self.output_path, payload)
+
+        # mtime=0 keeps the archive byte-identical when the list is unchanged
+        write_atomic(self.gzip_output_path, gzip.compress(payload, compresslevel=6, mtime=0))
+        print(f"[INFO] Saved {len(domains_list):,} domains to {self.output_path} (+ .gz)")
     
     def _save_stats(self, stats):
         """Save statistics to JSON file"""
-        encoding = self.global_config.get("encoding", "utf-8")
-        with open(self.stats_path, "w", encoding=encoding) as f:
-            json.dump(stats, f, indent=2, ensure_ascii=False)
+        write_atomic(self.stats_path, dump_json(stats))
         print(f"[INFO] Saved statistics to {self.stats_path}")
     
     @abstractmethod
@@ -3,12 +3,6 @@
 Gambling category implementation for domain blocklist.
 """
 
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from categories.base import BaseCategory
 from core.utils import format_number, format_datetime
 
@@ -27,7 +21,7 @@ class GamblingCategory(BaseCategory):
         successful_sources = stats.get('successful_sources', 0)
         added_this_run = stats.get('newly_added_count', 0)
 
-        readme_content = f"""# 🚫 {stats.get('name', 'Gambling')} Domain Blocklist
+        header = f"""# 🚫 {stats.get('name', 'Gambling')} Domain Blocklist
 
 {stats.get('description', 'Gambling domain blocklist')}
 
@@ -52,6 +46,7 @@ This list is cumulative; domains are only added and never removed to ensure a co
 """
 
         sources = stats.get('sources', {})
+        rows = []
         for source_name, source_data in sources.items():
             status = "❌" if source_data.get('status') == 'error' else "✅"
             raw_count = format_number(source_data.get('total_raw', 0))
@@ -59,9 +54,9 @@ This list is cumulative; domains are only added and never removed to ensure a co
 
             source_updated = format_datetime(source_data.get('last_updated', 'Unknown'))
 
-            readme_content += f"| {source_name} | {status} | {raw_count} | {normalized_count} | {source_updated} |\n"
+            rows.append(f"| {source_name} | {status} | {raw_count} | {normalized_count} | {source_updated} |\n")
         
-        readme_content += f"""
+        footer = f"""
 ## 🔄 Auto Update
 
 This blocklist is automatically updated using a modular system that can be extended for other categories.
@@ -94,4 +89,4 @@ https://raw.githubusercontent.com/your-repo/main/blocklist/{stats.get('output_fi
 *Generated automatically by modular blocklist system*
 """
         
-        return readme_content
+        return header + "".join(rows) + footer
@@ -3,14 +3,24 @@
 Domain fetcher module for retrieving blocklist data from various sources.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 from .utils import get_jakarta_time
 
 class DomainFetcher:
     """Handles fetching domain data from various sources"""
     
-    def __init__(self, timeout=15):
+    def __init__(self, timeout=15, max_workers=16):
         self.timeout = timeout
+        self.max_workers = max_workers
+
+        # Shared session so connections are kept alive and reused across sources
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=32)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
     def fetch_source(self, name, url):
         """
@@ -36,9 +46,13 @@ class DomainFetcher:
         }
         
         try:
-            resp = requests.get(url, timeout=self.timeout)
-            resp.raise_for_status()
-            lines = resp.text.splitlines()
+            # Stream the body so lines are decoded chunk by chunk instead of
+            # holding the raw bytes, the full decoded text and the lines at once
+            with self.session.get(url, timeout=self.timeout, stream=True) as resp:
+                resp.raise_for_status()
+                if resp.encoding is None:
+                    resp.encoding = "utf-8"
+                lines = list(resp.iter_lines(chunk_size=1 << 16, decode_unicode=True))
             
             stats.update({
                 'total_raw': len(lines),
@@ -54,23 +68,38 @@ class DomainFetcher:
     
     def fetch_multiple_sources(self, sources):
         """
-        Fetch from multiple sources
+        Fetch from multiple sources concurrently
         
         Args:
             sources (dict): Dictionary of source_name: url pairs
             
         Returns:
-            tuple: (all_data, all_stats)
-                all_data (list): Combined list of all raw lines
+            tuple: (all_data, all_stats, per_source_lines)
+                all_data (set): Unique raw lines across all sources
                 all_stats (dict): Statistics for each source
+                per_source_lines (dict): Raw lines of each successful source
         """
-        all_data = []
+        # Many public lists overlap, so duplicate lines are dropped here
+        # before they reach the normalizer
+        all_data = set()
         all_stats = {}
-        
-        for name, url in sources.items():
-            success, data, stats = self.fetch_source(name, url)
-            all_stats[name] = stats
-            if success:
-                all_data.extend(data)
-        
-        return all_data, all_stats
+        per_source_lines = {}
+
+        if not sources:
+            return all_data, all_stats, per_source_lines
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(sources))) as executor:
+            futures = {
+                name: executor.submit(self.fetch_source, name, url)
+                for name, url in sources.items()
+            }
+
+            # Collect in configuration order so stats output stays stable
+            for name, future in futures.items():
+                success, data, stats = future.result()
+                all_stats[name] = stats
+                if success:
+                    all_data.update(data)
+                    per_source_lines[name] = data
+
+        return all_data, all_stats, per_source_lines
@@ -5,12 +5,30 @@ Domain processor module for normalizing, validating, and processing domains.
 
 import re
 import os
+import functools
+from urllib.parse import urlparse
+
+# Patterns and prefixes used on every line, compiled once at import time
+# Anchoring is done by fullmatch(), which is cheaper than ^...$ in the pattern
+_DOMAIN_RE = re.compile(r"(?!-)[A-Za-z0-9-]{1,63}(?<!-)\.[A-Za-z]{2,}")
+# Anchored form kept for DomainProcessor.domain_regex, safe with search()/match()
+_ANCHORED_DOMAIN_RE = re.compile(r"^(?!-)[A-Za-z0-9-]{1,63}(?<!-)\.[A-Za-z]{2,}$")
+_COMMENT_CHARS = ("#", "!", ";")
+_HOSTS_PREFIXES = ("0.0.0.0", "127.0.0.1", "::1", "localhost")
+_PROTO_PREFIXES = ("http://", "https://", "ftp://")
+_HTTP_PREFIXES = ("http://", "https://")
+_SKIP_LINE_PREFIXES = ("#", "//", "/**", "**/")
+
+@functools.lru_cache(maxsize=None)
+def _compile_keywords(keywords):
+    """Compile a keyword tuple into one alternation pattern scanned in a single pass"""
+    return re.compile("|".join(map(re.escape, keywords)))
 
 class DomainProcessor:
     """Handles domain processing, validation, and management"""
     
     def __init__(self):
-        self.domain_regex = re.compile(r"^(?!-)[A-Za-z0-9-]{1,63}(?<!-)\.[A-Za-z]{2,}$")
+        self.domain_regex = _ANCHORED_DOMAIN_RE
     
     def normalize_domain(self, domain, source_name=None):
         """
@@ -29,7 +47,7 @@ class DomainProcessor:
         domain = domain.strip().lower()
 
         # Skip comments and empty lines
-        if not domain or domain.startswith('#') or domain.startswith('!') or domain.startswith(';'):
+        if not domain or domain.startswith(_COMMENT_CHARS):
             return ""
 
         # Handle CSV format (like PhishTank)
@@ -39,7 +57,6 @@ class DomainProcessor:
                 # PhishTank CSV: phish_id,url,phish_detail_url,submission_time,verified,verification_time,online,target
                 url = parts[1].strip('"')
                 if url.startswith('http'):
-                    from urllib.parse import urlparse
                     try:
                         parsed = urlparse(url)
                         domain = parsed.netloc
@@ -55,7 +72,7 @@ class DomainProcessor:
             domain = domain[2:]
 
         # Handle hosts file format (0.0.0.0 domain.com or 127.0.0.1 domain.com)
-        if domain.startswith(("0.0.0.0", "127.0.0.1", "::1", "localhost")):
+        if domain.startswith(_HOSTS_PREFIXES):
             parts = domain.split()
             domain = parts[1] if len(parts) > 1 else ""
 
@@ -64,10 +81,9 @@ class DomainProcessor:
         domain = domain.lstrip("*.").lstrip(".")
 
         # Remove protocol prefixes
-        if domain.startswith(("http://", "https://", "ftp://")):
-            from urllib.parse import urlparse
+        if domain.startswith(_PROTO_PREFIXES):
             try:
-                parsed = urlparse(domain if domain.startswith(('http://', 'https://')) else 'http://' + domain)
+                parsed = urlparse(domain if domain.startswith(_HTTP_PREFIXES) else 'http://' + domain)
                 domain = parsed.netloc
             except:
                 pass
@@ -97,7 +113,7 @@ class DomainProcessor:
         Returns:
             bool: True if domain is valid
         """
-        return bool(self.domain_regex.search(domain))
+        return _DOMAIN_RE.fullmatch(domain) is not None
     
     def has_priority_keywords(self, domain, keywords):
         """
@@ -110,32 +126,43 @@ class DomainProcessor:
         Returns:
             bool: True if domain contains any priority keyword
         """
-        return any(keyword in domain for keyword in keywords)
+        if not keywords:
+            return False
+        return _compile_keywords(tuple(keywords)).search(domain) is not None
     
-    def process_domains(self, raw_domains, priority_keywords=None, source_name=None):
+    def process_domains(self, raw_domains, priority_keywords=None, source_name=None, into=None):
         """
         Process and normalize a list of raw domains with source-specific handling
 
         Args:
-            raw_domains (list): List of raw domain strings
+            raw_domains (iterable): Raw domain strings (list or set)
             priority_keywords (list, optional): Keywords for priority domains
             source_name (str, optional): Name of the source for specific handling
+            into (set, optional): Existing set to add normalized domains to in place
 
         Returns:
             tuple: (normalized_domains, priority_domains)
-                normalized_domains (set): Set of all valid normalized domains
+                normalized_domains (set): Set of all valid normalized domains (``into`` if given)
                 priority_domains (set): Set of domains with priority keywords
         """
-        normalized_domains = set()
+        normalized_domains = into if into is not None else set()
         priority_domains = set()
+        keyword_re = _compile_keywords(tuple(priority_keywords)) if priority_keywords else None
 
         for raw_domain in raw_domains:
-            domain = self.normalize_domain(raw_domain, source_name)
-            if domain and self.is_valid_domain(domain):
-                normalized_domains.add(domain)
+            # Fast path: most lines in domain-only lists are already clean, so a
+            # single regex match replaces the full normalization chain. Hosts-style
+            # prefixes always take the slow path to keep identical results.
+            domain = raw_domain.strip().lower() if isinstance(raw_domain, str) else ""
+            if not _DOMAIN_RE.fullmatch(domain) or domain.startswith(_HOSTS_PREFIXES):
+                domain = self.normalize_domain(raw_domain, source_name)
+                if not domain or not self.is_valid_domain(domain):
+                    continue
 
-                if priority_keywords and self.has_priority_keywords(domain, priority_keywords):
-                    priority_domains.add(domain)
+            normalized_domains.add(domain)
+
+            if keyword_re is not None and keyword_re.search(domain):
+                priority_domains.add(domain)
 
         return normalized_domains, priority_domains
     
@@ -154,25 +181,26 @@ class DomainProcessor:
             return set()
 
         try:
+            # Read and decode the whole file at once instead of per line
+            with open(filepath, "rb") as f:
+                lines = f.read().decode("utf-8").splitlines()
+
             domains = set()
-            with open(filepath, "r", encoding="utf-8") as f:
-                in_header = False
-                for line in f:
-                    line = line.strip()
-
-                    # Skip header block
-                    if line.startswith("/**"):
-                        in_header = True
-                        continue
-                    elif line.startswith("**/"):
+            add = domains.add
+            in_header = False
+            for line in map(str.strip, lines):
+                # Skip header block
+                if in_header:
+                    if line.startswith("**/"):
                         in_header = False
-                        continue
-                    elif in_header:
-                        continue
+                    continue
+                if line.startswith("/**"):
+                    in_header = True
+                    continue
 
-                    # Add valid domain lines
-                    if line and not line.startswith("#") and not line.startswith("//"):
-                        domains.add(line)
+                # Add valid domain lines
+                if line and not line.startswith(_SKIP_LINE_PREFIXES):
+                    add(line)
 
             print(f"[INFO] Loaded {len(domains):,} existing domains from {filepath}")
             return domains
@@ -180,31 +208,61 @@ class DomainProcessor:
             print(f"[ERROR] Could not read existing file {filepath}: {e}")
             return set()
     
-    def merge_domains(self, existing_domains, new_domains, priority_domains=None):
+    def collapse_subdomains(self, domains):
+        """
+        Drop domains already covered by a listed parent domain
+
+        Domains are sorted by their reversed labels so every subdomain directly
+        follows its closest listed ancestor, which lets one sweep discard them.
+
+        Args:
+            domains (set): Set of domains to collapse
+
+        Returns:
+            set: Domains with covered subdomains removed
+        """
+        collapsed = set()
+        kept_labels = None
+
+        for labels in sorted(domain.split('.')[::-1] for domain in domains):
+            if kept_labels is not None and labels[:len(kept_labels)] == kept_labels:
+                continue
+            kept_labels = labels
+            collapsed.add('.'.join(labels[::-1]))
+
+        return collapsed
+
+    def merge_domains(self, existing_domains, new_domains, priority_domains=None, collapse_subdomains=False):
         """
         Merge existing and new domains with alphabetical sorting
 
         Args:
-            existing_domains (set): Set of existing domains
+            existing_domains (set): Set of existing domains (updated in place)
             new_domains (set): Set of new domains to add
             priority_domains (set, optional): Set of priority domains (ignored for general sorting)
+            collapse_subdomains (bool, optional): Drop subdomains covered by a listed parent
 
         Returns:
             tuple: (final_domains_list, merge_stats)
                 final_domains_list (list): Sorted list of all domains
                 merge_stats (dict): Statistics about the merge
         """
-        # Merge all domains
-        all_domains = existing_domains.union(new_domains)
-        newly_added = new_domains - existing_domains
+        # Merge in place instead of allocating a third set of the combined size
+        existing_count = len(existing_domains)
+        existing_domains |= new_domains
+        all_domains = existing_domains
+        newly_added_count = len(all_domains) - existing_count
+
+        if collapse_subdomains:
+            all_domains = self.collapse_subdomains(all_domains)
 
         # Sort alphabetically (no priority)
-        final_domains_list = sorted(list(all_domains))
+        final_domains_list = sorted(all_domains)
 
         merge_stats = {
-            'existing_count': len(existing_domains),
+            'existing_count': existing_count,
             'new_count': len(new_domains),
-            'newly_added_count': len(newly_added),
+            'newly_added_count': newly_added_count,
             'total_count': len(all_domains),
             'priority_count': 0  # No priority domains
         }
@@ -3,8 +3,16 @@
 Utility functions for domain blocklist management.
 """
 
+import functools
+import json
+import os
 from datetime import datetime, timezone, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Jakarta timezone
 JAKARTA_TZ = timezone(timedelta(hours=7))
 
@@ -12,10 +20,12 @@ def get_jakarta_time():
     """Get current time in Jakarta timezone"""
     return datetime.now(JAKARTA_TZ)
 
+@functools.lru_cache(maxsize=4096)
 def format_number(num):
     """Format number with thousand separators"""
     return f"{num:,}"
 
+@functools.lru_cache(maxsize=4096)
 def format_datetime(dt_string):
     """Format datetime string to readable format in Jakarta timezone"""
     try:
@@ -25,3 +35,61 @@ def format_datetime(dt_string):
         return dt.strftime('%Y-%m-%d %H:%M:%S WIB')
     except:
         return dt_string
+
+def dump_json(data, pretty=True):
+    """Serialize data to UTF-8 JSON bytes (indented or compact), using orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def write_atomic(filepath, data):
+    """
+    Write bytes to a file through a temporary file and an atomic rename
+
+    Readers never see a truncated file, and a crash mid-write leaves the
+    previous version in place. The data is flushed with a single fsync
+    before the rename.
+
+    Args:
+        filepath (str): Destination path
+        data (bytes): Complete file content
+    """
+    tmp_path = f"{filepath}.tmp"
+    try:
+        with open(tmp_path, "wb", buffering=1 << 20) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_if_changed(filepath, data):
+    """
+    Atomically write bytes to a file unless it already holds exactly that content
+
+    Args:
+        filepath (str): Destination path
+        data (bytes): Complete file content
+
+    Returns:
+        bool: True if the file was written, False if it was already up to date
+    """
+    try:
+        # Size check first so differing files are usually rejected without a read
+        if os.path.getsize(filepath) == len(data):
+            with open(filepath, "rb") as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+
+    write_atomic(filepath, data)
+    return True
@@ -6,16 +6,14 @@ Main script for modular domain blocklist system.
 import sys
 import os
 import argparse
-import json
-from categories import GamblingCategory, SuspiciousCategory, MaliciousCategory, AdultCategory
-from output import OutputGenerator, ReadmeGenerator
+import importlib
 
-# Registry of available categories
+# Registry of available categories as "module:ClassName", imported on demand
 CATEGORY_REGISTRY = {
-    'gambling': GamblingCategory,
-    'suspicious': SuspiciousCategory,
-    'malicious': MaliciousCategory,
-    'adult': AdultCategory
+    'gambling': 'categories.gambling:GamblingCategory',
+    'suspicious': 'categories.suspicious:SuspiciousCategory',
+    'malicious': 'categories.malicious:MaliciousCategory',
+    'adult': 'categories.adult:AdultCategory'
 }
 
 def get_available_categories():
@@ -32,8 +30,10 @@ def create_category(category_name):
     Returns:
         BaseCategory: Category instance or None if not found
     """
-    category_class = CATEGORY_REGISTRY.get(category_name)
-    if category_class:
+    category_path = CATEGORY_REGISTRY.get(category_name)
+    if category_path:
+        module_name, class_name = category_path.split(':')
+        category_class = getattr(importlib.import_module(module_name), class_name)
         return category_class()
     return None
 
@@ -109,6 +109,8 @@ def generate_combined_output(all_stats):
     print(f"{'='*60}")
 
     try:
+        from output import OutputGenerator, ReadmeGenerator
+
         # Generate combined statistics - save to parent directory
         script_dir = os.path.dirname(os.path.abspath(__file__))
         parent_dir = os.path.dirname(script_dir)
@@ -118,11 +120,8 @@ def generate_combined_output(all_stats):
             stats_dir=os.path.join(parent_dir, "blocklist", "stats"),
             root_dir=parent_dir
         )
-        combined_stats_path = output_gen.save_combined_stats(all_stats)
-
-        # Load combined stats for README generation
-        with open(combined_stats_path, 'r', encoding='utf-8') as f:
-            combined_stats = json.load(f)
+        combined_stats = output_gen.generate_combined_stats(all_stats)
+        combined_stats_path = output_gen.write_combined_stats(combined_stats)
 
         # Generate main README in root directory
         readme_gen = ReadmeGenerator()
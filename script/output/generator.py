@@ -4,54 +4,74 @@ Output generator for domain blocklist files and statistics.
 """
 
 import os
+import gzip
 import json
-import sys
+from concurrent.futures import ThreadPoolExecutor
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from core.utils import get_jakarta_time
+from core.utils import get_jakarta_time, dump_json, write_if_changed
 
 class OutputGenerator:
     """Handles generation of output files and statistics"""
     
+    # Absolute paths of directories already ensured in this process, shared by all instances
+    _created_dirs = set()
+    
     def __init__(self, output_dir="blocklist", stats_dir="blocklist/stats", encoding="utf-8", root_dir="."):
         self.output_dir = output_dir
         self.stats_dir = stats_dir
         self.encoding = encoding
         self.root_dir = root_dir
         
+        # One timestamp per run, shared by every combined stats generation
+        self._last_updated = get_jakarta_time().isoformat()
+        
         # Ensure directories exist
-        os.makedirs(output_dir, exist_ok=True)
-        os.makedirs(stats_dir, exist_ok=True)
+        for directory in (output_dir, stats_dir):
+            # Absolute paths so relative defaults stay correct after a chdir
+            directory = os.path.abspath(directory)
+            if directory not in self._created_dirs:
+                os.makedirs(directory, exist_ok=True)
+                self._created_dirs.add(directory)
     
-    def save_domains(self, domains_list, filename):
+    def save_domains(self, domains_list, filename, dedupe=False, sort=False):
         """
         Save domains list to a file
         
         Args:
             domains_list (list): List of domains to save
             filename (str): Output filename
+            dedupe (bool, optional): Drop duplicate domains before writing
+            sort (bool, optional): Sort domains alphabetically before writing
             
         Returns:
             str: Full path to saved file
         """
         filepath = os.path.join(self.output_dir, filename)
         
-        with open(filepath, "w", encoding=self.encoding) as f:
-            for domain in domains_list:
-                f.write(domain + "\n")
-        
-        print(f"[INFO] Saved {len(domains_list):,} domains to {filepath}")
+        if dedupe and sort:
+            domains_list = sorted(set(domains_list))
+        elif dedupe:
+            # dict.fromkeys keeps the first occurrence order
+            domains_list = list(dict.fromkeys(domains_list))
+        elif sort:
+            domains_list = sorted(domains_list)
+        
+        # Encode the whole list once and write it in a single call
+        payload = ("\n".join(domains_list) + "\n" if domains_list else "").encode(self.encoding)
+        if write_if_changed(filepath, payload):
+            print(f"[INFO] Saved {len(domains_list):,} domains to {filepath}")
+        else:
+            print(f"[INFO] {filepath} unchanged, skipped writing")
         return filepath
     
-    def save_stats(self, stats, category_name):
+    def save_stats(self, stats, category_name, pretty=True):
         """
         Save statistics to JSON file
         
         Args:
             stats (dict): Statistics dictionary
             category_name (str): Category name for filename
+            pretty (bool, optional): Indent the JSON, matching BaseCategory._save_stats
             
         Returns:
             str: Full path to saved stats file
@@ -59,12 +79,45 @@ class OutputGenerator:
         filename = f"{category_name}.json"
         filepath = os.path.join(self.stats_dir, filename)
         
-        with open(filepath, "w", encoding=self.encoding) as f:
-            json.dump(stats, f, indent=2, ensure_ascii=False)
-        
-        print(f"[INFO] Saved statistics to {filepath}")
+        if write_if_changed(filepath, dump_json(stats, pretty=pretty)):
+            print(f"[INFO] Saved statistics to {filepath}")
+        else:
+            print(f"[INFO] {filepath} unchanged, skipped writing")
         return filepath
     
+    def save_all_categories(self, category_outputs, readme_generator=None):
+        """
+        Save domains, statistics and optionally README for several categories concurrently
+        
+        Each category writes to its own files, so the writes run in a thread
+        pool without any locking. Files are written through the category's own
+        savers so they keep the header and the matching .gz copy.
+        
+        Args:
+            category_outputs (list): List of (domains_list, stats, category) tuples
+            readme_generator (ReadmeGenerator, optional): Generator for category READMEs
+            
+        Returns:
+            list: Paths to the saved domains files, in input order
+        """
+        if not category_outputs:
+            return []
+        
+        def save_category(category_output):
+            domains_list, stats, category = category_output
+            if not category._dirs_ready:
+                os.makedirs(os.path.dirname(category.output_path), exist_ok=True)
+                os.makedirs(os.path.dirname(category.stats_path), exist_ok=True)
+                category._dirs_ready = True
+            category._save_domains(domains_list)
+            category._save_stats(stats)
+            if readme_generator is not None:
+                readme_generator.generate_category_readme(category, stats, self.output_dir)
+            return category.output_path
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(category_outputs))) as executor:
+            return list(executor.map(save_category, category_outputs))
+    
     def load_stats(self, category_name):
         """
         Load statistics from JSON file
@@ -93,13 +146,13 @@ class OutputGenerator:
         Generate combined statistics from multiple categories
         
         Args:
-            category_stats_list (list): List of category statistics
+            category_stats_list (list): List of category statistics dictionaries
             
         Returns:
             dict: Combined statistics
         """
         combined_stats = {
-            'last_updated': get_jakarta_time().isoformat(),
+            'last_updated': self._last_updated,
             'total_categories': len(category_stats_list),
             'categories': {},
             'summary': {
@@ -109,40 +162,71 @@ class OutputGenerator:
             }
         }
         
+        categories = combined_stats['categories']
+        total_domains = total_sources = successful_sources = 0
+        
         for stats in category_stats_list:
             category_name = stats.get('category', 'unknown')
-            combined_stats['categories'][category_name] = {
+            category_domains = stats.get('total_count', 0)
+            category_sources = stats.get('total_sources', 0)
+            category_successful = stats.get('successful_sources', 0)
+            
+            categories[category_name] = {
                 'name': stats.get('name', category_name.title()),
                 'description': stats.get('description', ''),
-                'total_domains': stats.get('total_count', 0),
-                'sources': stats.get('total_sources', 0),
-                'successful_sources': stats.get('successful_sources', 0),
+                'total_domains': category_domains,
+                'sources': category_sources,
+                'successful_sources': category_successful,
                 'last_updated': stats.get('last_updated', ''),
                 'output_file': stats.get('output_file', f'{category_name}.txt')
             }
             
-            # Update summary
-            combined_stats['summary']['total_domains'] += stats.get('total_count', 0)
-            combined_stats['summary']['total_sources'] += stats.get('total_sources', 0)
-            combined_stats['summary']['successful_sources'] += stats.get('successful_sources', 0)
+            total_domains += category_domains
+            total_sources += category_sources
+            successful_sources += category_successful
+        
+        # Update summary
+        summary = combined_stats['summary']
+        summary['total_domains'] = total_domains
+        summary['total_sources'] = total_sources
+        summary['successful_sources'] = successful_sources
         
         return combined_stats
     
-    def save_combined_stats(self, category_stats_list):
+    def save_combined_stats(self, category_stats_list, pretty=False):
         """
         Save combined statistics for all categories
         
         Args:
             category_stats_list (list): List of category statistics
+            pretty (bool, optional): Indent the JSON instead of writing it compact
             
         Returns:
             str: Path to saved combined stats file
         """
         combined_stats = self.generate_combined_stats(category_stats_list)
+        return self.write_combined_stats(combined_stats, pretty=pretty)
+    
+    def write_combined_stats(self, combined_stats, pretty=False):
+        """
+        Write already generated combined statistics to file
+        
+        Args:
+            combined_stats (dict): Combined statistics from generate_combined_stats()
+            pretty (bool, optional): Indent the JSON instead of writing it compact
+            
+        Returns:
+            str: Path to saved combined stats file
+        """
         filepath = os.path.join(self.stats_dir, "combined.json")
+        payload = dump_json(combined_stats, pretty=pretty)
         
-        with open(filepath, "w", encoding=self.encoding) as f:
-            json.dump(combined_stats, f, indent=2, ensure_ascii=False)
+        if write_if_changed(filepath, payload):
+            print(f"[INFO] Saved combined statistics to {filepath}")
+        else:
+            print(f"[INFO] {filepath} unchanged, skipped writing")
         
-        print(f"[INFO] Saved combined statistics to {filepath}")
+        # Compressed copy for distribution, reusing the serialized bytes;
+        # mtime=0 keeps it byte-identical when the stats are unchanged
+        write_if_changed(f"{filepath}.gz", gzip.compress(payload, compresslevel=1, mtime=0))
         return filepath
@@ -4,12 +4,17 @@ README generator for domain blocklist documentation.
 """
 
 import os
-import sys
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.utils import format_number, format_datetime, write_if_changed
 
-from core.utils import format_number, format_datetime
+# Static part of the main README, built once instead of on every render
+_SOURCES_SECTION = """
+
+## 📚 Sources
+
+[Hagezi DNS Blocklists](https://github.com/hagezi/dns-blocklists), [Steven Black Hosts](https://github.com/StevenBlack/hosts), [Blocklist Project](https://blocklistproject.github.io/), [AdGuard Filters](https://adguard.com/en/adguard-browser-extension/filters.html), [Disconnect.me](https://disconnect.me/), [Firebog](https://firebog.net/), [MajkiIT Polish Filters](https://github.com/MajkiIT/polish-ads-filter), [SomeoneWhoCares Hosts](https://someonewhocares.org/hosts/), [TrustPositif Indonesia](https://trustpositif.kominfo.go.id/), [WinHelp2002 Hosts](https://winhelp2002.mvps.org/), [AdAway](https://adaway.org/), [OISD Blocklist](https://oisd.nl/), [OpenPhish](https://openphish.com/), [CERT.PL](https://cert.pl/), [Mitchell Krogza Phishing Database](https://github.com/mitchellkrogza/Phishing.Database), [Spam404](https://github.com/Spam404/lists), [Cybercrime Tracker](https://cybercrime-tracker.net/), [Malware-Filter Project](https://gitlab.com/malware-filter/malware-filter), [Abuse.ch](https://abuse.ch/), [DShield](https://www.dshield.org/), [Chad Mayfield Pi-hole Lists](https://github.com/chadmayfield/my-pihole-blocklists), [Tiuxo Hosts](https://github.com/tiuxo/hosts)
+
+"""
 
 class ReadmeGenerator:
     """Handles generation of README files for categories and main project"""
@@ -35,10 +40,10 @@ class ReadmeGenerator:
         readme_filename = f"README_{category.category_name}.md"
         readme_path = os.path.join(output_dir, readme_filename)
         
-        with open(readme_path, "w", encoding=self.encoding) as f:
-            f.write(readme_content)
-        
-        print(f"[INFO] Generated README for {category.name}: {readme_path}")
+        if write_if_changed(readme_path, readme_content.encode(self.encoding)):
+            print(f"[INFO] Generated README for {category.name}: {readme_path}")
+        else:
+            print(f"[INFO] {readme_path} unchanged, skipped writing")
         return readme_path
     
     def generate_main_readme(self, combined_stats, output_dir="."):
@@ -57,7 +62,7 @@ class ReadmeGenerator:
         summary = combined_stats.get('summary', {})
         categories = combined_stats.get('categories', {})
         
-        readme_content = f"""# 🌌 Lyra - Mapping the universe of threats
+        header = f"""# 🌌 Lyra - Mapping the universe of threats
 
 From scattered stars to a unified galaxy, collects and harmonizes blocklists from across the public universe, creating a singular, clean, and unique list.
 
@@ -75,30 +80,33 @@ From scattered stars to a unified galaxy, collects and harmonizes blocklists fro
 |----------|---------|---------|--------|------|
 """
 
-        for category_name, category_data in categories.items():
-            name = category_data.get('name', category_name.title())
-            domains_count = format_number(category_data.get('total_domains', 0))
-            sources_status = f"{category_data.get('successful_sources', 0)}/{category_data.get('sources', 0)}"
-            status = "✅ Active" if category_data.get('successful_sources', 0) > 0 else "❌ Inactive"
-            output_file = category_data.get('output_file', f'{category_name}.txt')
-
-            readme_content += f"| {name} | {domains_count} | {sources_status} | {status} | [`{output_file}`](blocklist/{output_file}) |\n"
+        rows = "".join(
+            self._format_category_row(category_name, category_data)
+            for category_name, category_data in categories.items()
+        )
 
-        readme_content += f"""
-
-## 📚 Sources
-
-[Hagezi DNS Blocklists](https://github.com/hagezi/dns-blocklists), [Steven Black Hosts](https://github.com/StevenBlack/hosts), [Blocklist Project](https://blocklistproject.github.io/), [AdGuard Filters](https://adguard.com/en/adguard-browser-extension/filters.html), [Disconnect.me](https://disconnect.me/), [Firebog](https://firebog.net/), [MajkiIT Polish Filters](https://github.com/MajkiIT/polish-ads-filter), [SomeoneWhoCares Hosts](https://someonewhocares.org/hosts/), [TrustPositif Indonesia](https://trustpositif.kominfo.go.id/), [WinHelp2002 Hosts](https://winhelp2002.mvps.org/), [AdAway](https://adaway.org/), [OISD Blocklist](https://oisd.nl/), [OpenPhish](https://openphish.com/), [CERT.PL](https://cert.pl/), [Mitchell Krogza Phishing Database](https://github.com/mitchellkrogza/Phishing.Database), [Spam404](https://github.com/Spam404/lists), [Cybercrime Tracker](https://cybercrime-tracker.net/), [Malware-Filter Project](https://gitlab.com/malware-filter/malware-filter), [Abuse.ch](https://abuse.ch/), [DShield](https://www.dshield.org/), [Chad Mayfield Pi-hole Lists](https://github.com/chadmayfield/my-pihole-blocklists), [Tiuxo Hosts](https://github.com/tiuxo/hosts)
-
----
+        footer = f"""---
 
 *Last updated: {last_updated}*
 *Generated automatically by Lyra - Mapping the universe of threats*
 """
         
+        readme_content = "".join((header, rows, _SOURCES_SECTION, footer))
         readme_path = os.path.join(output_dir, "README.md")
-        with open(readme_path, "w", encoding=self.encoding) as f:
-            f.write(readme_content)
-        
-        print(f"[INFO] Generated main README: {readme_path}")
+        if write_if_changed(readme_path, readme_content.encode(self.encoding)):
+            print(f"[INFO] Generated main README: {readme_path}")
+        else:
+            print(f"[INFO] {readme_path} unchanged, skipped writing")
         return readme_path
+    
+    def _format_category_row(self, category_name, category_data):
+        """Format one category row of the main README table"""
+        successful_sources = category_data.get('successful_sources', 0)
+        output_file = category_data.get('output_file', f'{category_name}.txt')
+        return (
+            f"| {category_data.get('name', category_name.title())} "
+            f"| {format_number(category_data.get('total_domains', 0))} "
+            f"| {successful_sources}/{category_data.get('sources', 0)} "
+            f"| {'✅ Active' if successful_sources > 0 else '❌ Inactive'} "
+            f"| [`{output_file}`](blocklist/{output_file}) |\n"
+        )